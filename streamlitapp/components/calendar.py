@@ -1,3 +1,5 @@
+import datetime
+
 import pandas as pd
 import streamlit as st
 import streamlit_calendar as st_cal
@@ -13,18 +15,28 @@ def available_calendar_views() -> dict[str, str]:
     return {"Week": "timeGridWeek", "List": "list"}
 
 
-def default_calendar_options(calendar_view: str):
+def default_calendar_options(
+    calendar_view: str,
+    programme_date_range: tuple[datetime.date, datetime.date],
+    programme_time_range: tuple[datetime.time, datetime.time],
+):
+    first_date, last_date = programme_date_range
+    first_time, last_time = programme_time_range
+    # FullCalendar treats the end of a range as exclusive, hence the extra day after the last conference day
+    range_end = last_date + datetime.timedelta(days=1)
+    visible_start = first_date - datetime.timedelta(days=1)
+
     general_options = {
         "editable": "true",
         "navLinks": "true",
         "selectable": "true",
         "resources": [],
         # Control the limitations on the calendar browsing and display
-        "slotMinTime": "08:00:00",
-        "slotMaxTime": "19:00:00",
+        "slotMinTime": first_time.isoformat(),
+        "slotMaxTime": last_time.isoformat(),
         "validRange": {
-            "start": "2024-07-01",
-            "end": "2024-07-04",
+            "start": first_date.isoformat(),
+            "end": range_end.isoformat(),
         },
         "initialView": calendar_view,
     }
@@ -46,7 +58,7 @@ def default_calendar_options(calendar_view: str):
         }
     }
     time_grid_week_view_config = {
-        "duration": {"days": 4},
+        "duration": {"days": (range_end - visible_start).days},
         "slotLabelFormat": [
             {"hour": "2-digit", "minute": "2-digit", "hour12": False},
         ],
@@ -57,8 +69,8 @@ def default_calendar_options(calendar_view: str):
             "hour12": False,
         },
         "visibleRange": {  # Disable if looking at only the visible week
-            "start": "2024-06-30",
-            "end": "2024-07-04",
+            "start": visible_start.isoformat(),
+            "end": range_end.isoformat(),
         },
     }
 
@@ -96,7 +108,11 @@ def generate_events_for_calendar(events: pd.DataFrame, must_attend_sessions: lis
     return events_list
 
 
-def render_calendar_from_sessions(df_selected_sessions: pd.DataFrame) -> None:
+def render_calendar_from_sessions(
+    df_selected_sessions: pd.DataFrame,
+    programme_date_range: tuple[datetime.date, datetime.date],
+    programme_time_range: tuple[datetime.time, datetime.time],
+) -> None:
     must_attend_sessions = st.session_state.get('must_attend_sessions', [])
 
     dict_available_calendar_views = available_calendar_views()
@@ -104,5 +120,5 @@ def render_calendar_from_sessions(df_selected_sessions: pd.DataFrame) -> None:
     calendar_view_value = dict_available_calendar_views[calendar_view_name]
 
     all_events = generate_events_for_calendar(df_selected_sessions, must_attend_sessions)
-    options = default_calendar_options(calendar_view_value)
+    options = default_calendar_options(calendar_view_value, programme_date_range, programme_time_range)
     _ = st_cal.calendar(events=all_events, options=options)
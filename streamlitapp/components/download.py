@@ -0,0 +1,48 @@
+from typing import Callable, Iterable
+
+import pandas as pd
+import streamlit as st
+
+import export.programme as programme_export
+
+"""
+This module contains the download component of the Streamlit app, which lets users take the (filtered) programme or
+their optimised schedule away in one of the supported export formats.
+"""
+
+
+def render_export_download(
+    get_programme_chunks: Callable[[], Iterable[pd.DataFrame]],
+    dataset_id: str,
+    filename_stem: str,
+    key: str,
+) -> None:
+    dict_export_formats = programme_export.available_export_formats()
+
+    col_export = st.columns(2)
+    export_format_name = col_export[0].selectbox(
+        "Export format",
+        dict_export_formats.keys(),
+        index=None,
+        placeholder="Export as ...",
+        key=f"{key}_export_format",
+        label_visibility="collapsed",
+    )
+    if export_format_name is None:
+        return
+
+    # The download button requires the complete file, so it is only built when the user asks for it. As the file is not
+    # kept around, any later rerun releases it again
+    export_action = col_export[1].empty()
+    if not export_action.button("Prepare export", key=f"{key}_prepare_export"):
+        return
+
+    export_format = dict_export_formats[export_format_name]
+    export_payload = b"".join(programme_export.stream_export(get_programme_chunks(), export_format, dataset_id))
+    export_action.download_button(
+        f"Download as {export_format_name}",
+        data=export_payload,
+        file_name=f"{filename_stem}.{export_format}",
+        mime=programme_export.export_mime_types()[export_format],
+        key=f"{key}_download",
+    )
@@ -3,6 +3,14 @@ import os
 import streamlit as st
 
 
+def read_secrets_section(section: str) -> dict:
+    # Outside of the app, e.g. for the command line tools, there might not be a secrets file at all
+    try:
+        return dict(st.secrets.get(section, {}))
+    except FileNotFoundError:
+        return {}
+
+
 class AppConfig:
     ROOT_DIR: str = os.path.join(os.path.dirname(__file__), "..")
     DATASET_DIR: str = os.path.join(ROOT_DIR, "datasets")
@@ -14,7 +22,20 @@ class AppConfig:
 
     FILEPATH_CONFERENCE_PROGRAMME: str = os.path.join(DATASET_DIR, FILENAME_CONFERENCE_PROGRAMME)
 
+    # Every conference programme the app can serve, identified by its dataset id. Additional programmes (e.g. the
+    # synthetic ones created with generate_programme.py) can be registered in the [datasets] section of the secrets
+    DEFAULT_DATASET_ID: str = "euro2024"
+    DATASETS: dict[str, dict[str, str]] = {
+        DEFAULT_DATASET_ID: {
+            "name": "EURO2024",
+            "filename": FILENAME_CONFERENCE_PROGRAMME,
+            "export_date": DATE_OF_PROGRAMME_EXPORT,
+            "programme_link": CONFERENCE_PROGRAMME_LINK,
+        },
+        **read_secrets_section("datasets"),
+    }
+
     ABSTRACT_DISPLAY_LIMIT: int = 10
 
-    __FEATURE_TOGGLES: dict[str, str] = st.secrets.get("feature_toggles", {})
+    __FEATURE_TOGGLES: dict[str, str] = read_secrets_section("feature_toggles")
     SHOW_OPTIMIZATION_TAB: bool = ast.literal_eval(__FEATURE_TOGGLES.get("show_optimization_tab", "False"))
@@ -1,52 +1,80 @@
-import pandas as pd
-import streamlit as st
+from typing import Any, Mapping
 
+import numpy as np
+import streamlit as st
 
-def has_overlapping_keywords(kws_to_check: list[str], flt_kws: list[str]) -> bool:
-    overlapping_keywords = set(kws_to_check).intersection(flt_kws)
-    return len(overlapping_keywords) > 0
+from data.plane import ProgrammeDataPlane, ProgrammeSelection, read_only
 
 
-def filter_programme_based_on_state(df_programme: pd.DataFrame) -> pd.DataFrame:
-    df_filtered = df_programme.copy()
+def select_programme_rows(
+    data_plane: ProgrammeDataPlane,
+    flt_timeslots: tuple[str, ...],
+    flt_streams: tuple[str, ...],
+    flt_keywords: tuple[str, ...],
+    title_text_search: str,
+    abstract_text_search: str,
+) -> np.ndarray:
+    row_ids = data_plane.all_row_ids()
 
-    # Ensure that the filters are applied. We can extract the filters from the session state
-    flt_timeslots = st.session_state.get("selected_timeslots", [])
     if len(flt_timeslots) > 0:
-        df_filtered = df_filtered[df_filtered["Schedule"].isin(flt_timeslots)]
+        timeslot_row_ids = data_plane.rows_with_values("Schedule", list(flt_timeslots))
+        row_ids = np.intersect1d(row_ids, timeslot_row_ids, assume_unique=True)
 
-    flt_streams = st.session_state.get("selected_streams", [])
     if len(flt_streams) > 0:
-        df_filtered = df_filtered[df_filtered["Stream Name"].isin(flt_streams)]
+        stream_row_ids = data_plane.rows_with_values("Stream Name", list(flt_streams))
+        row_ids = np.intersect1d(row_ids, stream_row_ids, assume_unique=True)
 
-    flt_keywords = st.session_state.get("selected_keywords", [])
     if len(flt_keywords) > 0:
-        # Check for overlap in the keywords
-        df_filtered = df_filtered[
-            df_filtered["Keywords"].apply(lambda x: has_overlapping_keywords(x, flt_keywords))
-        ]
+        # Rows are included as soon as there is an overlap in the keywords
+        keyword_row_ids = data_plane.rows_with_values("Keywords", list(flt_keywords))
+        row_ids = np.intersect1d(row_ids, keyword_row_ids, assume_unique=True)
 
-    title_text_search = st.session_state.get("title_search", '')
     if title_text_search.strip(' ') != '':
-        df_filtered = df_filtered[
-            df_filtered["Title"].str.contains(title_text_search, case=False)
-        ]
+        row_ids = data_plane.rows_containing_text("Contribution Title", title_text_search, row_ids)
 
-    abstract_text_search = st.session_state.get("abstract_search", '')
     if abstract_text_search.strip(' ') != '':
-        df_filtered = df_filtered[
-            df_filtered["Abstract"].str.contains(abstract_text_search, case=False)
-        ]
+        row_ids = data_plane.rows_containing_text("Abstract", abstract_text_search, row_ids)
 
-    return df_filtered
+    return read_only(row_ids)
 
 
-def filter_optimization_input_based_on_state(df_programme: pd.DataFrame) -> pd.DataFrame:
-    df_filtered = df_programme.copy()
+def filter_programme_based_on_state(
+    data_plane: ProgrammeDataPlane, state: Mapping[str, Any] | None = None
+) -> ProgrammeSelection:
+    # Without an explicit state, e.g. when exporting outside of the app, the filters are taken from the session state
+    state = st.session_state if state is None else state
 
     # Ensure that the filters are applied. We can extract the filters from the session state
-    flt_streams = st.session_state.get("opt_selected_stream", [])
-    if len(flt_streams) > 0:
-        df_filtered = df_filtered[df_filtered["Stream Name"].isin(flt_streams)]
+    flt_timeslots = tuple(state.get("selected_timeslots", []))
+    flt_streams = tuple(state.get("selected_streams", []))
+    flt_keywords = tuple(state.get("selected_keywords", []))
+    title_text_search = state.get("title_search", '')
+    abstract_text_search = state.get("abstract_search", '')
+
+    # Sessions using the same filters share the selected row ids, rather than each holding a copy of the programme
+    filter_key = ("programme", flt_timeslots, flt_streams, flt_keywords, title_text_search, abstract_text_search)
+    row_ids = data_plane.get_or_compute(
+        filter_key,
+        lambda: select_programme_rows(
+            data_plane, flt_timeslots, flt_streams, flt_keywords, title_text_search, abstract_text_search
+        ),
+    )
+    return ProgrammeSelection(filter_key=filter_key, row_ids=row_ids)
+
+
+def filter_optimization_input_based_on_state(
+    data_plane: ProgrammeDataPlane, state: Mapping[str, Any] | None = None
+) -> ProgrammeSelection:
+    state = st.session_state if state is None else state
+
+    # Ensure that the filters are applied. We can extract the filters from the session state
+    flt_streams = tuple(state.get("opt_selected_stream", []))
+
+    filter_key = ("optimization_input", flt_streams)
+    if len(flt_streams) == 0:
+        return ProgrammeSelection(filter_key=filter_key, row_ids=data_plane.all_row_ids())
 
-    return df_filtered
+    row_ids = data_plane.get_or_compute(
+        filter_key, lambda: data_plane.rows_with_values("Stream Name", list(flt_streams))
+    )
+    return ProgrammeSelection(filter_key=filter_key, row_ids=row_ids)
@@ -1,10 +1,9 @@
 import ast
 import pandas as pd
-import streamlit as st
 
 
-# Data caching will make the app more stable and performant
-@st.cache_data
+# The prepared programme is not cached here, as the data plane built from it is already shared by all sessions. A data
+# cache would keep a second, pickled copy of the programme next to it
 def load_and_prepare_programme_data(filepath: str) -> pd.DataFrame:
     list_typed_columns = ["all_keyword_ids", "authors", "keywords"]
     date_typed_columns = ["date"]
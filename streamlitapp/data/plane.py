@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Iterator, TypeVar
+
+import numpy as np
+import pandas as pd
+
+"""
+This module contains the data plane of the app: a read-only conference programme which is shared by all sessions within
+the process. Besides the programme itself, it holds indexes on the columns used for filtering and a bounded cache of
+derived results, like the rows matching a set of filters. Sessions only keep small handles to the data plane, i.e. the
+filter values and the row ids of their selection, and materialise the rows they need when rendering.
+"""
+
+T = TypeVar("T")
+
+INDEXED_COLUMNS: list[str] = ["Schedule", "Stream Name", "Session Name", "Keywords"]
+LIST_TYPED_INDEXED_COLUMNS: list[str] = ["Keywords"]
+
+
+def estimate_size_in_bytes(result: Any) -> int:
+    # Derived results are either NumPy arrays, like selected row ids, or (short) tuples of unique values
+    if isinstance(result, np.ndarray):
+        return result.nbytes
+    if isinstance(result, (list, tuple)):
+        return sys.getsizeof(result) + sum(sys.getsizeof(element) for element in result)
+    return sys.getsizeof(result)
+
+
+def read_only(array: np.ndarray) -> np.ndarray:
+    # Shared arrays are handed out to many sessions at once, so none of them should be able to modify them in place
+    array.flags.writeable = False
+    return array
+
+
+@dataclass(frozen=True)
+class ProgrammeSelection:
+    filter_key: tuple[Hashable, ...]
+    row_ids: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.row_ids)
+
+
+@dataclass(frozen=True)
+class ColumnIndex:
+    # Every (row id, value) pair of a column, with the values encoded as positions in the list of unique values
+    row_ids: np.ndarray
+    value_codes: np.ndarray
+    unique_values: pd.Index
+
+
+class ProgrammeDataPlane:
+    __dataset_id: str
+    __df_programme: pd.DataFrame
+    __dict_column_indexes: dict[str, ColumnIndex]
+    __all_row_ids: np.ndarray
+
+    __derived_results: OrderedDict[Hashable, tuple[Any, int]]
+    __derived_results_size: int
+    __derived_results_limit_bytes: int
+    __lock: threading.Lock
+
+    def __init__(
+        self, dataset_id: str, df_programme: pd.DataFrame, derived_results_limit_bytes: int = 32 * 1024 ** 2
+    ) -> None:
+        # Row ids are positions in the programme, hence the data plane owns a copy with a plain range index
+        self.__dataset_id = dataset_id
+        self.__df_programme = df_programme.reset_index(drop=True)
+        self.__all_row_ids = read_only(np.arange(len(self.__df_programme), dtype=np.int32))
+        self.__dict_column_indexes = {
+            column: self.__create_column_index(column)
+            for column in INDEXED_COLUMNS
+        }
+
+        self.__derived_results = OrderedDict()
+        self.__derived_results_size = 0
+        self.__derived_results_limit_bytes = derived_results_limit_bytes
+        self.__lock = threading.Lock()
+
+    @property
+    def dataset_id(self) -> str:
+        return self.__dataset_id
+
+    def __len__(self) -> int:
+        return len(self.__df_programme)
+
+    def all_row_ids(self) -> np.ndarray:
+        return self.__all_row_ids
+
+    def column_values(self, column: str) -> np.ndarray:
+        # A read-only view on the column, only extension typed columns require a conversion
+        return read_only(self.__df_programme[column].to_numpy().view())
+
+    def unique_values(self, column: str, row_ids: np.ndarray | None = None) -> tuple[Any, ...]:
+        # Unique values are returned in order of their first appearance in the programme
+        column_index = self.__dict_column_indexes[column]
+        if row_ids is None:
+            return tuple(column_index.unique_values)
+
+        value_codes = np.unique(column_index.value_codes[np.isin(column_index.row_ids, row_ids)])
+        # Missing values are encoded as -1, and are not part of the unique values
+        return tuple(column_index.unique_values[value_codes[value_codes >= 0]])
+
+    def rows_with_values(self, column: str, values: list[Any]) -> np.ndarray:
+        # For list typed columns, a row matches as soon as one of its values is among the requested ones
+        column_index = self.__dict_column_indexes[column]
+        requested_codes = column_index.unique_values.get_indexer(values)
+
+        matching_entries = np.isin(column_index.value_codes, requested_codes[requested_codes >= 0])
+        return read_only(np.unique(column_index.row_ids[matching_entries]))
+
+    def rows_containing_text(self, column: str, text: str, row_ids: np.ndarray) -> np.ndarray:
+        # Only the rows which are still part of the selection have to be searched. The text is searched for literally, as
+        # users type e.g. parentheses without meaning a regular expression
+        column_values = self.__df_programme[column].take(row_ids)
+        contains_text = column_values.str.contains(text, case=False, regex=False, na=False).to_numpy(dtype=bool)
+        return read_only(row_ids[contains_text])
+
+    def take(self, row_ids: np.ndarray, columns: list[str] | None = None) -> pd.DataFrame:
+        # Materialises the selected rows as a new, session-owned DataFrame, copying only the requested columns
+        if columns is None:
+            return self.__df_programme.take(row_ids)
+
+        return pd.DataFrame({column: self.__df_programme[column].take(row_ids) for column in columns})
+
+    def take_in_chunks(
+        self, row_ids: np.ndarray, chunk_size: int, columns: list[str] | None = None
+    ) -> Iterator[pd.DataFrame]:
+        # Materialises the selected rows one chunk at a time, e.g. to export them. An empty selection still results in a
+        # single, empty chunk, which carries the columns and their types
+        for start in range(0, max(len(row_ids), 1), chunk_size):
+            yield self.take(row_ids[start:start + chunk_size], columns=columns)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], T]) -> T:
+        # Derived results are shared between sessions, hence they should be immutable, i.e. read-only arrays or tuples.
+        # The cache is bounded by the total size of the results, as e.g. every keystroke in a text search leads to a new
+        # result. The least recently used results are dropped first
+        with self.__lock:
+            if key in self.__derived_results:
+                self.__derived_results.move_to_end(key)
+                return self.__derived_results[key][0]
+
+        result = compute()
+        result_size = estimate_size_in_bytes(result)
+        if result_size > self.__derived_results_limit_bytes:
+            return result
+
+        with self.__lock:
+            if key in self.__derived_results:
+                self.__derived_results_size -= self.__derived_results.pop(key)[1]
+
+            self.__derived_results[key] = (result, result_size)
+            self.__derived_results_size += result_size
+            while self.__derived_results_size > self.__derived_results_limit_bytes:
+                _, (_, dropped_size) = self.__derived_results.popitem(last=False)
+                self.__derived_results_size -= dropped_size
+
+        return result
+
+    def __create_column_index(self, column: str) -> ColumnIndex:
+        column_values = self.__df_programme[column]
+        row_ids = self.__all_row_ids
+
+        if column in LIST_TYPED_INDEXED_COLUMNS:
+            column_values = column_values.explode().dropna()
+            row_ids = column_values.index.to_numpy(dtype=np.int32)
+
+        value_codes, unique_values = pd.factorize(column_values)
+        return ColumnIndex(
+            row_ids=read_only(np.asarray(row_ids)),
+            value_codes=read_only(value_codes.astype(np.int32)),
+            unique_values=unique_values,
+        )
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+
+import pandas as pd
+import streamlit as st
+
+import data.load as data_loader
+import data.utils as data_utils
+from config import AppConfig
+from data.plane import ProgrammeDataPlane
+
+
+@dataclass(frozen=True)
+class ConferenceDataset:
+    dataset_id: str
+    name: str
+    filename: str
+    export_date: str = ""
+    programme_link: str = ""
+
+    @property
+    def filepath(self) -> str:
+        # Relative filenames are resolved against the dataset directory, absolute paths are used as-is
+        return os.path.join(AppConfig.DATASET_DIR, self.filename)
+
+
+def available_datasets() -> dict[str, ConferenceDataset]:
+    return {
+        dataset_id: ConferenceDataset(
+            dataset_id=dataset_id,
+            name=details["name"],
+            filename=details["filename"],
+            export_date=details.get("export_date", ""),
+            programme_link=details.get("programme_link", ""),
+        )
+        for dataset_id, details in AppConfig.DATASETS.items()
+    }
+
+
+def get_dataset(dataset_id: str) -> ConferenceDataset:
+    all_datasets = available_datasets()
+    if dataset_id not in all_datasets:
+        raise UnknownDatasetException.for_dataset_id(dataset_id, list(all_datasets.keys()))
+
+    return all_datasets[dataset_id]
+
+
+def load_programme(dataset_id: str) -> pd.DataFrame:
+    # All programmes share the same prepared format. Every call reads the file again, see load_data_plane for the cache
+    dataset = get_dataset(dataset_id)
+    return data_loader.load_and_prepare_programme_data(dataset.filepath)
+
+
+# Resources are shared by all sessions without being copied, so every process holds a single data plane per programme
+@st.cache_resource
+def load_data_plane(dataset_id: str) -> ProgrammeDataPlane:
+    df_programme = load_programme(dataset_id)
+    df_programme = data_utils.assign_random_utilities_to_programme_entries(df_programme)
+    return ProgrammeDataPlane(dataset_id, df_programme)
+
+
+class UnknownDatasetException(Exception):
+
+    @classmethod
+    def for_dataset_id(cls, dataset_id: str, known_dataset_ids: list[str]) -> UnknownDatasetException:
+        known_ids_str = ", ".join(known_dataset_ids)
+        return cls(f"Unknown dataset {dataset_id}, expected one of {known_ids_str}")
@@ -0,0 +1,110 @@
+import ast
+
+import numpy as np
+import pandas as pd
+
+"""
+This module generates synthetic conference programmes that follow the schema of the exported conference programme CSV
+files. The generated programmes reuse the timeslot structure of the source programme, while the number of parallel
+streams is multiplied by the requested scale factor. Talks, keywords, authors and texts are sampled from the empirical
+distributions found in the source programme, so that the synthetic programmes can be used to capacity test the app.
+"""
+
+LIST_TYPED_COLUMNS = ["all_keyword_ids", "authors", "keywords"]
+ID_TYPED_COLUMNS = ["session", "stream", "timeslot", "paper_id"]
+
+SESSION_LEVEL_COLUMNS = [
+    "session",
+    "session_name",
+    "stream",
+    "timeslot",
+    "track",
+    "stream_name",
+    "schedule",
+    "day",
+    "time",
+    "start_time",
+    "end_time",
+    "date",
+    "room",
+    "track_code",
+]
+
+
+def read_raw_programme(filepath: str) -> pd.DataFrame:
+    # Read the programme without any preparation, such that the synthetic programme can be written in the same schema
+    df_raw = pd.read_csv(filepath, dtype=str, keep_default_na=False)
+    for col in LIST_TYPED_COLUMNS:
+        df_raw[col] = df_raw[col].apply(ast.literal_eval)
+    for col in ID_TYPED_COLUMNS:
+        df_raw[col] = df_raw[col].astype(int)
+
+    return df_raw
+
+
+def sample_texts(rng: np.random.Generator, source_texts: pd.Series, number_of_texts: int) -> list[str]:
+    # Texts are built from the vocabulary of the source, with a word count following the source's length distribution
+    tokenized_texts = source_texts.str.split()
+    vocabulary = tokenized_texts.explode().dropna().tolist()
+
+    # Sampling word positions per text keeps memory proportional to a single text, even for very large programmes
+    text_lengths = rng.choice(tokenized_texts.str.len().to_numpy(), size=number_of_texts)
+    return [
+        " ".join(vocabulary[position] for position in rng.integers(0, len(vocabulary), size=text_length))
+        for text_length in text_lengths
+    ]
+
+
+def generate_synthetic_programme(df_source: pd.DataFrame, scale: int, seed: int = 42) -> pd.DataFrame:
+    if scale < 1:
+        raise ValueError(f"Scale factor should be a positive integer, got {scale}")
+
+    rng = np.random.default_rng(seed)
+
+    df_source_sessions = df_source[SESSION_LEVEL_COLUMNS].drop_duplicates(subset=["session"])
+    talks_per_session = df_source.groupby("session").size().to_numpy()
+    authors_per_talk = df_source["authors"].str.len().to_numpy()
+    max_author_id = max(max(authors) for authors in df_source["authors"] if len(authors) > 0)
+
+    # Each copy of the source's sessions gets its own ids, names and rooms, so the copies run as parallel streams
+    session_id_offset = df_source["session"].max() + 1
+    stream_id_offset = df_source["stream"].max() + 1
+
+    all_session_copies = []
+    for copy_index in range(scale):
+        df_sessions = df_source_sessions.copy()
+        df_sessions["session"] += copy_index * session_id_offset
+        df_sessions["stream"] += copy_index * stream_id_offset
+
+        if copy_index > 0:
+            suffix = f" [{copy_index + 1}]"
+            for col in ["session_name", "stream_name", "room", "track_code"]:
+                df_sessions[col] = df_sessions[col] + suffix
+
+        all_session_copies.append(df_sessions)
+
+    df_sessions = pd.concat(all_session_copies, ignore_index=True)
+
+    # Expand every session into talks, following the number of talks per session found in the source programme
+    number_of_talks = rng.choice(talks_per_session, size=len(df_sessions))
+    df_synthetic = df_sessions.loc[df_sessions.index.repeat(number_of_talks)].reset_index(drop=True)
+    df_synthetic["paper_id"] = np.arange(1, len(df_synthetic) + 1)
+
+    # Keywords are topic-related, hence each talk borrows its keywords from a random talk in the same source stream
+    source_talks_per_stream = df_source.groupby("stream").indices
+    source_streams = (df_synthetic["stream"] % stream_id_offset).to_numpy()
+    sampled_talk_positions = [rng.choice(source_talks_per_stream[stream]) for stream in source_streams]
+    df_sampled_talks = df_source.iloc[sampled_talk_positions].reset_index(drop=True)
+    df_synthetic["keywords"] = df_sampled_talks["keywords"]
+    df_synthetic["all_keyword_ids"] = df_sampled_talks["all_keyword_ids"]
+
+    number_of_authors = rng.choice(authors_per_talk, size=len(df_synthetic))
+    df_synthetic["authors"] = [
+        rng.integers(1, max_author_id + 1, size=n_authors).tolist() for n_authors in number_of_authors
+    ]
+
+    df_synthetic["title"] = sample_texts(rng, df_source["title"], len(df_synthetic))
+    df_synthetic["abstract"] = sample_texts(rng, df_source["abstract"], len(df_synthetic))
+
+    df_synthetic.sort_values(by=["timeslot", "stream", "session"], inplace=True)
+    return df_synthetic[df_source.columns]
@@ -1,36 +1,35 @@
+import datetime
 import random
 
 import pandas as pd
 import streamlit as st
 
+from data.plane import ProgrammeDataPlane
+
 random.seed(42)
 
 
-def get_unique_timeslots(df_programme: pd.DataFrame) -> list[str]:
+def get_unique_timeslots(data_plane: ProgrammeDataPlane) -> tuple[str, ...]:
     # We do not want to filter the timeslots, so we can just return the unique values
-    return df_programme["Schedule"].unique().tolist()
+    return data_plane.unique_values("Schedule")
 
 
-def get_unique_streams(df_programme: pd.DataFrame, filter_by_state: bool) -> list[str]:
+def get_unique_streams(data_plane: ProgrammeDataPlane, filter_by_state: bool) -> tuple[str, ...]:
     # For getting the streams, we want to limit ourselves to only those which are being organized
     # during the selected timeslots - if any were selected. This leads to some kind of hierarchical filtering
-    if filter_by_state is False:
-        unique_streams = df_programme["Stream Name"].unique().tolist()
-        unique_streams.sort()
-        return unique_streams
+    flt_timeslots = tuple(st.session_state.get("selected_timeslots", [])) if filter_by_state else ()
+
+    def compute_unique_streams() -> tuple[str, ...]:
+        row_ids = None
+        if len(flt_timeslots) > 0:
+            row_ids = data_plane.rows_with_values("Schedule", list(flt_timeslots))
 
-    df_filtered = df_programme.copy()
-    # Ensure that the filters are applied. We can extract the filters from the session state
-    flt_timeslots = st.session_state.get("selected_timeslots", [])
-    if len(flt_timeslots) > 0:
-        df_filtered = df_filtered[df_filtered["Schedule"].isin(flt_timeslots)]
+        return tuple(sorted(data_plane.unique_values("Stream Name", row_ids)))
 
-    unique_streams = df_filtered["Stream Name"].unique().tolist()
-    unique_streams.sort()
-    return unique_streams
+    return data_plane.get_or_compute(("unique_streams", flt_timeslots), compute_unique_streams)
 
 
-def get_preselected_streams(available_streams: list[str]) -> list[str]:
+def get_preselected_streams(available_streams: tuple[str, ...]) -> list[str]:
     last_selected_streams = set(st.session_state.get("selected_streams", []))
     remaining_streams = set(available_streams).intersection(last_selected_streams)
     remaining_streams = list(remaining_streams)
@@ -39,32 +38,48 @@ def get_preselected_streams(available_streams: list[str]) -> list[str]:
     return remaining_streams
 
 
-def get_unique_keywords(df_programme: pd.DataFrame) -> list[str]:
+def get_unique_keywords(data_plane: ProgrammeDataPlane) -> tuple[str, ...]:
     # We do not want to pre-filter the keywords as there is not really a hierarchical structure
-    stacked_keywords = df_programme["Keywords"].apply(pd.Series).stack()
+    return data_plane.get_or_compute(
+        ("unique_keywords",), lambda: tuple(sorted(data_plane.unique_values("Keywords")))
+    )
 
-    unique_keywords = stacked_keywords.unique().tolist()
-    unique_keywords.sort()
 
-    return unique_keywords
+def get_programme_date_range(data_plane: ProgrammeDataPlane) -> tuple[datetime.date, datetime.date]:
+    # The first and last day on which the conference has talks scheduled, both inclusive
+    all_dates = data_plane.column_values("Date")
+    first_date = pd.Timestamp(all_dates.min()).date()
+    last_date = pd.Timestamp(all_dates.max()).date()
+    return first_date, last_date
 
 
+def get_programme_time_range(data_plane: ProgrammeDataPlane) -> tuple[datetime.time, datetime.time]:
+    # The earliest start and the latest end of a talk on any day, widened to full hours for the calendar grid
+    start_times = pd.Series(data_plane.column_values("Start Timestamp"))
+    end_times = pd.Series(data_plane.column_values("End Timestamp"))
+    earliest_start = (start_times - start_times.dt.normalize()).min()
+    latest_end = (end_times - end_times.dt.normalize()).max()
 
+    first_hour = earliest_start.floor("h")
+    last_hour = min(latest_end.ceil("h"), pd.Timedelta(hours=23, minutes=59, seconds=59))
+    return (datetime.datetime.min + first_hour).time(), (datetime.datetime.min + last_hour).time()
 
-def get_unique_sessions_for_optimization_model(df_programme: pd.DataFrame) -> list[str]:
-    df_filtered = df_programme.copy()
 
+def get_unique_sessions_for_optimization_model(data_plane: ProgrammeDataPlane) -> tuple[str, ...]:
     # Ensure that the relevant filters are applied. We can extract the filters from the session state
-    flt_streams = st.session_state.get("opt_selected_stream", [])
-    if len(flt_streams) > 0:
-        df_filtered = df_filtered[df_filtered["Stream Name"].isin(flt_streams)]
+    flt_streams = tuple(st.session_state.get("opt_selected_stream", []))
+
+    def compute_unique_sessions() -> tuple[str, ...]:
+        row_ids = None
+        if len(flt_streams) > 0:
+            row_ids = data_plane.rows_with_values("Stream Name", list(flt_streams))
+
+        return tuple(sorted(data_plane.unique_values("Session Name", row_ids)))
 
-    unique_streams = df_filtered["Session Name"].unique().tolist()
-    unique_streams.sort()
-    return unique_streams
+    return data_plane.get_or_compute(("unique_sessions", flt_streams), compute_unique_sessions)
 
 
-def get_preselected_sessions_for_optimization_model(available_sessions: list[str]) -> list[str]:
+def get_preselected_sessions_for_optimization_model(available_sessions: tuple[str, ...]) -> list[str]:
     last_selected_sessions = set(st.session_state.get("must_attend_sessions", []))
     remaining_sessions = set(available_sessions).intersection(last_selected_sessions)
     remaining_sessions = list(remaining_sessions)
@@ -73,7 +88,6 @@ def get_preselected_sessions_for_optimization_model(available_sessions: list[str
     return remaining_sessions
 
 
-@st.cache_data
 def assign_random_utilities_to_programme_entries(df_programme: pd.DataFrame) -> pd.DataFrame:
     # For illustration purposes, we will assign random utilities to the programme entries
     df_programme["Utility"] = [round(10 * random.random(), 2) for _ in range(len(df_programme))]
@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import datetime
+import functools
+import io
+import itertools
+from typing import Any, Iterable, Iterator
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+"""
+This module exports (filtered) conference programmes and optimised schedules. All formats are produced as a stream of
+byte chunks, generated from chunks of rows which are e.g. taken from the data plane one at a time, such that exporting
+the complete programme including its abstracts does not require a copy of the programme in memory.
+"""
+
+DEFAULT_CHUNK_SIZE: int = 500
+ICAL_LINE_LIMIT: int = 75
+
+# Object columns are exported as strings, except for the list typed ones whose element type does not follow from the dtype
+LIST_COLUMN_ARROW_TYPES: dict[str, pa.DataType] = {
+    "Authors": pa.list_(pa.int64()),
+    "All Keyword Ids": pa.list_(pa.int64()),
+    "Keywords": pa.list_(pa.string()),
+}
+
+
+def available_export_formats() -> dict[str, str]:
+    return {"iCalendar": "ics", "CSV": "csv", "Parquet": "parquet"}
+
+
+def export_mime_types() -> dict[str, str]:
+    return {"ics": "text/calendar", "csv": "text/csv", "parquet": "application/octet-stream"}
+
+
+def iter_programme_chunks(df_programme: pd.DataFrame, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+    # Like the chunks taken from the data plane, an empty programme still results in a single, empty chunk
+    for start in range(0, max(len(df_programme), 1), chunk_size):
+        yield df_programme.iloc[start:start + chunk_size]
+
+
+def iter_csv_chunks(programme_chunks: Iterable[pd.DataFrame]) -> Iterator[bytes]:
+    # The header is written for the first chunk only, which is there also when there are no rows to export at all
+    for chunk_number, df_chunk in enumerate(programme_chunks):
+        yield df_chunk.to_csv(index=False, header=chunk_number == 0).encode("utf-8")
+
+
+class _ChunkSink(io.RawIOBase):
+    # Parquet writers need to know the position in the file, so we keep track of it while handing out the written bytes
+    def __init__(self) -> None:
+        super().__init__()
+        self.__position = 0
+        self.__pending_chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        data = bytes(data)
+        self.__pending_chunks.append(data)
+        self.__position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.__position
+
+    def drain(self) -> bytes:
+        data = b"".join(self.__pending_chunks)
+        self.__pending_chunks = []
+        return data
+
+
+def get_arrow_schema(df_programme: pd.DataFrame) -> pa.Schema:
+    # Types follow from the dtypes rather than the values, which could e.g. all be missing within a chunk of rows
+    fields = []
+    for column, dtype in df_programme.dtypes.items():
+        if column in LIST_COLUMN_ARROW_TYPES:
+            arrow_type = LIST_COLUMN_ARROW_TYPES[column]
+        elif dtype == np.dtype(object):
+            arrow_type = pa.string()
+        else:
+            arrow_type = pa.from_numpy_dtype(dtype)
+        fields.append(pa.field(column, arrow_type))
+
+    return pa.schema(fields)
+
+
+def iter_parquet_chunks(programme_chunks: Iterable[pd.DataFrame]) -> Iterator[bytes]:
+    # Every chunk of rows is written as a separate row group, and all chunks share the columns of the first one
+    programme_chunks = iter(programme_chunks)
+    df_first_chunk = next(programme_chunks)
+    schema = get_arrow_schema(df_first_chunk)
+    sink = _ChunkSink()
+
+    with pq.ParquetWriter(sink, schema) as writer:
+        for df_chunk in itertools.chain([df_first_chunk], programme_chunks):
+            writer.write_table(pa.Table.from_pandas(df_chunk, schema=schema, preserve_index=False))
+            yield sink.drain()
+
+    yield sink.drain()
+
+
+def escape_ical_text(value: Any) -> str:
+    if isinstance(value, list):
+        value = ", ".join(str(element) for element in value)
+
+    text = str(value)
+    for character in ["\\", ";", ","]:
+        text = text.replace(character, f"\\{character}")
+    return text.replace("\r\n", "\\n").replace("\n", "\\n")
+
+
+def fold_ical_line(line: str) -> str:
+    # Content lines should not exceed 75 octets, longer ones continue on the next line starting with a space
+    encoded_line = line.encode("utf-8")
+    if len(encoded_line) <= ICAL_LINE_LIMIT:
+        return line + "\r\n"
+
+    folded_parts = []
+    start = 0
+    limit = ICAL_LINE_LIMIT
+    while len(encoded_line) - start > limit:
+        # Never split a multi-byte character, i.e. move the cut back while it points at a UTF-8 continuation byte
+        end = start + limit
+        while encoded_line[end] & 0xC0 == 0x80:
+            end -= 1
+
+        folded_parts.append(encoded_line[start:end])
+        start = end
+        limit = ICAL_LINE_LIMIT - 1
+    folded_parts.append(encoded_line[start:])
+
+    return b"\r\n ".join(folded_parts).decode("utf-8") + "\r\n"
+
+
+def format_ical_timestamp(timestamp: pd.Timestamp) -> str:
+    # The programme timestamps are local to the conference venue, hence they are exported as floating times
+    return timestamp.strftime("%Y%m%dT%H%M%S")
+
+
+def generate_ical_event(event: dict[str, Any], dataset_id: str, export_timestamp: str) -> str:
+    # Programme entries are individual talks, whereas optimised schedules only contain session-level details
+    if "Paper Id" in event:
+        uid = f"{dataset_id}-paper-{event['Paper Id']}"
+        summary = event["Contribution Title"]
+    else:
+        uid = f"{dataset_id}-session-{event['Track Code']}"
+        summary = event["Session Name"]
+
+    event_lines = [
+        "BEGIN:VEVENT",
+        f"UID:{uid}@conference-programme-explorer",
+        f"DTSTAMP:{export_timestamp}",
+        f"DTSTART:{format_ical_timestamp(event['Start Timestamp'])}",
+        f"DTEND:{format_ical_timestamp(event['End Timestamp'])}",
+        f"SUMMARY:{escape_ical_text(summary)}",
+    ]
+    if pd.notna(event.get("Room")):
+        event_lines.append(f"LOCATION:{escape_ical_text(event['Room'])}")
+
+    description_parts = [
+        f"{column}: {event[column]}"
+        for column in ["Session Name", "Stream Name", "Track Code", "Schedule"]
+        if column in event
+    ]
+    if "Abstract" in event:
+        description_parts.append(str(event["Abstract"]))
+    event_lines.append(f"DESCRIPTION:{escape_ical_text(chr(10).join(description_parts))}")
+
+    if "Keywords" in event and len(event["Keywords"]) > 0:
+        # Categories are separated by plain commas, whereas commas within a keyword are escaped
+        categories = ",".join(escape_ical_text(keyword) for keyword in event["Keywords"])
+        event_lines.append(f"CATEGORIES:{categories}")
+
+    event_lines.append("END:VEVENT")
+    return "".join(fold_ical_line(line) for line in event_lines)
+
+
+def iter_ical_chunks(programme_chunks: Iterable[pd.DataFrame], dataset_id: str) -> Iterator[bytes]:
+    # Paper ids and track codes are only unique within a conference, hence the dataset id is part of the event UIDs.
+    # All events of an export share the moment of exporting, in UTC, as their DTSTAMP
+    export_timestamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    calendar_header = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:-//conference-programme-explorer//EN",
+        "CALSCALE:GREGORIAN",
+    ]
+    yield "".join(fold_ical_line(line) for line in calendar_header).encode("utf-8")
+
+    for df_chunk in programme_chunks:
+        events = df_chunk.to_dict(orient="records")
+        yield "".join(generate_ical_event(event, dataset_id, export_timestamp) for event in events).encode("utf-8")
+
+    yield fold_ical_line("END:VCALENDAR").encode("utf-8")
+
+
+def stream_export(programme_chunks: Iterable[pd.DataFrame], export_format: str, dataset_id: str) -> Iterator[bytes]:
+    dict_chunk_generators = {
+        "ics": functools.partial(iter_ical_chunks, dataset_id=dataset_id),
+        "csv": iter_csv_chunks,
+        "parquet": iter_parquet_chunks,
+    }
+    if export_format not in dict_chunk_generators:
+        raise UnsupportedExportFormatException.for_format(export_format)
+
+    yield from dict_chunk_generators[export_format](programme_chunks)
+
+
+def write_export(
+    programme_chunks: Iterable[pd.DataFrame], export_format: str, filepath: str, dataset_id: str
+) -> None:
+    with open(filepath, "wb") as file:
+        for chunk in stream_export(programme_chunks, export_format, dataset_id):
+            file.write(chunk)
+
+
+class UnsupportedExportFormatException(Exception):
+
+    @classmethod
+    def for_format(cls, export_format: str) -> UnsupportedExportFormatException:
+        supported_formats_str = ", ".join(available_export_formats().values())
+        return cls(f"Unsupported export format {export_format}, expected one of {supported_formats_str}")
@@ -0,0 +1,148 @@
+import argparse
+import json
+import os
+import re
+from typing import Any, Iterator
+
+import data.filter as data_filter
+import data.registry as data_registry
+import export.programme as programme_export
+import optimizer.schedule as optimizer_schedule
+from config import AppConfig
+from optimizer.max_session_utility import CannotRetrieveResultsException
+
+"""
+Command line tool to batch export personalised schedules without running the app. Attendees are read from a JSON Lines
+file, with one attendee per line using the same keys as the filters in the app, e.g.:
+
+    {"attendee": "jane_doe", "opt_selected_stream": ["Keynotes"], "must_attend_sessions": ["Bahar Yetis Kara"]}
+
+    python streamlitapp/export_schedules.py --attendees attendees.jsonl --output-dir schedules --format ics
+
+Using `--content programme`, the filtered programme (selected_timeslots, selected_streams, selected_keywords,
+title_search and abstract_search) is exported instead of the optimised schedule.
+"""
+
+LIST_TYPED_SELECTION_KEYS: list[str] = [
+    "selected_timeslots",
+    "selected_streams",
+    "selected_keywords",
+    "opt_selected_stream",
+    "must_attend_sessions",
+]
+TEXT_TYPED_SELECTION_KEYS: list[str] = ["title_search", "abstract_search"]
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Batch export personalised conference schedules")
+    parser.add_argument("--attendees", required=True, help="JSON Lines file with the selections of each attendee")
+    parser.add_argument("--output-dir", required=True, help="Directory to write one export per attendee to")
+    parser.add_argument(
+        "--format", default="ics", choices=programme_export.available_export_formats().values(), help="Export format"
+    )
+    parser.add_argument(
+        "--content",
+        default="schedule",
+        choices=["schedule", "programme"],
+        help="Export the optimised schedule or the filtered programme",
+    )
+    parser.add_argument("--dataset", default=AppConfig.DEFAULT_DATASET_ID, help="Id of the conference programme")
+    parser.add_argument(
+        "--chunk-size", type=int, default=programme_export.DEFAULT_CHUNK_SIZE, help="Number of rows per written chunk"
+    )
+    return parser.parse_args()
+
+
+def iter_attendee_selections(filepath: str) -> Iterator[tuple[int, dict[str, Any] | None]]:
+    # Attendees are read one at a time, so the number of attendees does not affect the memory usage. Lines which cannot
+    # be parsed are passed on as None, such that they can be skipped without aborting the whole batch
+    with open(filepath) as file:
+        for line_number, line in enumerate(file, start=1):
+            if line.strip() == "":
+                continue
+
+            try:
+                selection = json.loads(line)
+            except json.JSONDecodeError:
+                selection = None
+
+            yield line_number, selection if isinstance(selection, dict) else None
+
+
+def find_invalid_selection(selection: dict[str, Any]) -> str | None:
+    # The filters expect lists of strings, whereas e.g. a single string would silently be read as a list of characters
+    attendee = selection.get("attendee")
+    if not isinstance(attendee, str) or attendee.strip() == "":
+        return "missing attendee"
+
+    for key in LIST_TYPED_SELECTION_KEYS:
+        values = selection.get(key, [])
+        if not isinstance(values, list) or not all(isinstance(value, str) for value in values):
+            return f"{key} should be a list of strings"
+
+    for key in TEXT_TYPED_SELECTION_KEYS:
+        if not isinstance(selection.get(key, ""), str):
+            return f"{key} should be a string"
+
+    return None
+
+
+def get_export_filename(attendee: str) -> str:
+    # Attendees end up in the filename, so anything which could point outside of the output directory is replaced
+    return re.sub(r"[^\w\-]", "_", attendee)
+
+
+def main() -> None:
+    arguments = parse_arguments()
+    os.makedirs(arguments.output_dir, exist_ok=True)
+
+    data_plane = data_registry.load_data_plane(arguments.dataset)
+
+    number_of_exports = 0
+    for line_number, selection in iter_attendee_selections(arguments.attendees):
+        if selection is None:
+            print(f"Skipping line {line_number}: not a JSON object")
+            continue
+
+        invalid_selection_reason = find_invalid_selection(selection)
+        if invalid_selection_reason is not None:
+            print(f"Skipping line {line_number}: {invalid_selection_reason}")
+            continue
+
+        attendee = selection["attendee"]
+
+        if arguments.content == "programme":
+            programme_selection = data_filter.filter_programme_based_on_state(data_plane, state=selection)
+            # The filtered programme can be as large as the complete one, hence it is taken one chunk at a time
+            programme_chunks = data_plane.take_in_chunks(programme_selection.row_ids, arguments.chunk_size)
+        else:
+            optimization_input_selection = data_filter.filter_optimization_input_based_on_state(
+                data_plane, state=selection
+            )
+            df_available_programme = data_plane.take(
+                optimization_input_selection.row_ids, columns=optimizer_schedule.OPTIMIZATION_INPUT_COLUMNS
+            )
+            try:
+                df_to_export = optimizer_schedule.get_optimal_set_of_sessions(
+                    df_available_programme, selection.get("must_attend_sessions", [])
+                )
+            except CannotRetrieveResultsException as exception:
+                print(f"Skipping {attendee}: {exception}")
+                continue
+
+            if len(df_to_export) == 0:
+                print(f"Skipping {attendee}: no sessions match the selected streams")
+                continue
+
+            programme_chunks = programme_export.iter_programme_chunks(df_to_export, arguments.chunk_size)
+
+        filename_export = f"{get_export_filename(attendee)}.{arguments.format}"
+        filepath_export = os.path.join(arguments.output_dir, filename_export)
+        programme_export.write_export(programme_chunks, arguments.format, filepath_export, arguments.dataset)
+        number_of_exports += 1
+
+    print(f"Exported {number_of_exports} {arguments.content}s to {arguments.output_dir}")
+
+
+if __name__ == '__main__':
+    main()
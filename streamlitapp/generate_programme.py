@@ -0,0 +1,43 @@
+import argparse
+import os
+
+import data.synthetic as data_synthetic
+from config import AppConfig
+
+"""
+Command line tool to generate a synthetic conference programme, e.g. to capacity test the app with programmes which
+are much larger than the bundled EURO2024 one:
+
+    python streamlitapp/generate_programme.py --scale 10 --output 20240621_synthetic_x10_conference_programme.csv
+
+The generated file is written to the dataset directory, and can be served by registering it in the [datasets]
+section of the .streamlit/secrets.toml file.
+"""
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate a synthetic conference programme")
+    parser.add_argument(
+        "--source",
+        default=AppConfig.FILEPATH_CONFERENCE_PROGRAMME,
+        help="Programme CSV file whose schema and distributions are used",
+    )
+    parser.add_argument("--scale", type=int, default=10, help="Number of times the parallel streams are multiplied")
+    parser.add_argument("--seed", type=int, default=42, help="Seed of the random number generator")
+    parser.add_argument("--output", required=True, help="Filename of the generated programme CSV file")
+    return parser.parse_args()
+
+
+def main() -> None:
+    arguments = parse_arguments()
+
+    df_source = data_synthetic.read_raw_programme(arguments.source)
+    df_synthetic = data_synthetic.generate_synthetic_programme(df_source, arguments.scale, seed=arguments.seed)
+
+    filepath_output = os.path.join(AppConfig.DATASET_DIR, arguments.output)
+    df_synthetic.to_csv(filepath_output, index=False)
+    print(f"Generated {len(df_synthetic)} talks in {df_synthetic['session'].nunique()} sessions to {filepath_output}")
+
+
+if __name__ == '__main__':
+    main()
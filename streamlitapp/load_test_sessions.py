@@ -0,0 +1,160 @@
+import argparse
+import gc
+import os
+import random
+import resource
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import data.filter as data_filter
+import data.registry as data_registry
+import data.utils as data_utils
+import optimizer.schedule as optimizer_schedule
+from config import AppConfig
+from data.plane import ProgrammeDataPlane, ProgrammeSelection
+from optimizer.max_session_utility import CannotRetrieveResultsException
+
+"""
+Load test simulating many concurrent sessions of the app within a single process, to show that the resident memory
+scales with the size of the programme rather than with the number of sessions. Every simulated session picks random
+filters, renders its selection like the browsing tab does, optimises its schedule like the optimiser tab does and keeps
+its handles, i.e. the filters and selected row ids, alive until the end of the test. The test fails when the memory
+grows by more than the given bound between the smallest and the largest number of sessions:
+
+    python streamlitapp/load_test_sessions.py --sessions 10 50 100 250 500
+"""
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure resident memory for an increasing number of sessions")
+    parser.add_argument("--dataset", default=AppConfig.DEFAULT_DATASET_ID, help="Id of the conference programme")
+    parser.add_argument(
+        "--sessions", type=int, nargs="+", default=[10, 50, 100, 250, 500], help="Numbers of sessions to measure at"
+    )
+    parser.add_argument("--workers", type=int, default=8, help="Number of sessions running concurrently")
+    parser.add_argument("--seed", type=int, default=42, help="Seed of the random filter selections")
+    parser.add_argument(
+        "--warmup-sessions",
+        type=int,
+        default=50,
+        help="Number of sessions simulated and discarded before measuring, to reach the memory of concurrent reruns",
+    )
+    parser.add_argument(
+        "--max-growth-mb",
+        type=float,
+        default=50.0,
+        help="Maximum growth of the resident memory between the smallest and the largest number of sessions",
+    )
+    return parser.parse_args()
+
+
+def current_resident_memory_mb() -> float:
+    # The current resident set size is only available on Linux, elsewhere we fall back to the peak resident set size
+    if os.path.exists("/proc/self/statm"):
+        with open("/proc/self/statm") as file:
+            resident_pages = int(file.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / 1024 ** 2
+
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def generate_random_session_state(data_plane: ProgrammeDataPlane, rng: random.Random) -> dict[str, Any]:
+    all_timeslots = data_utils.get_unique_timeslots(data_plane)
+    all_streams = data_utils.get_unique_streams(data_plane, filter_by_state=False)
+    all_keywords = data_utils.get_unique_keywords(data_plane)
+
+    session_state = {}
+    if rng.random() < 0.5:
+        session_state["selected_timeslots"] = rng.sample(all_timeslots, rng.randint(1, 3))
+    if rng.random() < 0.5:
+        session_state["selected_streams"] = rng.sample(all_streams, rng.randint(1, 5))
+    if rng.random() < 0.5:
+        session_state["selected_keywords"] = rng.sample(all_keywords, rng.randint(1, 3))
+    if rng.random() < 0.2:
+        session_state["title_search"] = rng.choice(["optimization", "learning", "routing", "scheduling"])
+
+    # Most users restrict the optimisation to a few streams, and some of them also have sessions they must attend
+    if rng.random() < 0.8:
+        session_state["opt_selected_stream"] = rng.sample(all_streams, rng.randint(1, 3))
+    if rng.random() < 0.3:
+        all_sessions = data_plane.unique_values("Session Name")
+        session_state["must_attend_sessions"] = rng.sample(all_sessions, 1)
+
+    return session_state
+
+
+def simulate_session(
+    data_plane: ProgrammeDataPlane, session_state: dict[str, Any]
+) -> tuple[ProgrammeSelection, ProgrammeSelection]:
+    programme_selection = data_filter.filter_programme_based_on_state(data_plane, state=session_state)
+
+    # Like the browsing tab, only the displayed columns are materialised, and they are dropped after the rerun
+    displayed_columns = ['Schedule', 'Session Name', 'Contribution Title', 'Track Code', 'Keywords']
+    df_displayed = data_plane.take(programme_selection.row_ids, columns=displayed_columns)
+
+    # Like the optimiser tab, the schedule is optimised over the session-level columns of the selected streams
+    optimization_input_selection = data_filter.filter_optimization_input_based_on_state(data_plane, state=session_state)
+    df_available_programme = data_plane.take(
+        optimization_input_selection.row_ids, columns=optimizer_schedule.OPTIMIZATION_INPUT_COLUMNS
+    )
+    try:
+        df_selected_sessions = optimizer_schedule.get_optimal_set_of_sessions(
+            df_available_programme, session_state.get("must_attend_sessions", [])
+        )
+    except CannotRetrieveResultsException:
+        df_selected_sessions = optimizer_schedule.create_empty_schedule()
+
+    del df_displayed, df_available_programme, df_selected_sessions
+    return programme_selection, optimization_input_selection
+
+
+def main() -> None:
+    arguments = parse_arguments()
+    rng = random.Random(arguments.seed)
+
+    data_plane = data_registry.load_data_plane(arguments.dataset)
+    gc.collect()
+    baseline_memory_mb = current_resident_memory_mb()
+    print(f"Data plane with {len(data_plane)} talks loaded, resident memory {baseline_memory_mb:.1f} MB")
+
+    # The handles are kept alive on purpose, as the session state of a connected browser session would do
+    session_handles: list[tuple[dict[str, Any], tuple[ProgrammeSelection, ProgrammeSelection]]] = []
+    dict_memory_per_number_of_sessions: dict[int, float] = {}
+
+    with ThreadPoolExecutor(max_workers=arguments.workers) as executor:
+        # The memory allocator holds on to the peak memory of reruns running concurrently, e.g. when optimising the
+        # complete programme, which is reached in a warm-up round of sessions whose handles are not kept
+        warmup_states = [generate_random_session_state(data_plane, rng) for _ in range(arguments.warmup_sessions)]
+        list(executor.map(lambda state: simulate_session(data_plane, state), warmup_states))
+        gc.collect()
+        print(f"Warm-up with {arguments.warmup_sessions} sessions, resident memory {current_resident_memory_mb():.1f} MB")
+
+        for number_of_sessions in sorted(arguments.sessions):
+            new_states = [
+                generate_random_session_state(data_plane, rng)
+                for _ in range(number_of_sessions - len(session_handles))
+            ]
+            new_handles = executor.map(lambda state: simulate_session(data_plane, state), new_states)
+            session_handles.extend(zip(new_states, new_handles))
+
+            gc.collect()
+            memory_mb = current_resident_memory_mb()
+            dict_memory_per_number_of_sessions[number_of_sessions] = memory_mb
+            print(
+                f"{number_of_sessions:>6} sessions: resident memory {memory_mb:.1f} MB "
+                f"({memory_mb - baseline_memory_mb:+.1f} MB compared to the loaded data plane)"
+            )
+
+    all_measurements = list(dict_memory_per_number_of_sessions.values())
+    memory_growth_mb = all_measurements[-1] - all_measurements[0]
+    if memory_growth_mb > arguments.max_growth_mb:
+        raise SystemExit(
+            f"FAILED: resident memory grew by {memory_growth_mb:.1f} MB, "
+            f"which is more than the allowed {arguments.max_growth_mb:.1f} MB"
+        )
+
+    print(f"PASSED: resident memory grew by {memory_growth_mb:.1f} MB, at most {arguments.max_growth_mb:.1f} MB allowed")
+
+
+if __name__ == '__main__':
+    main()
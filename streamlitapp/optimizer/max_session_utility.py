@@ -5,18 +5,38 @@ from typing import Any
 import pandas as pd
 import pulp
 
+# The columns which the session-level model is built from, a session's utility is the mean utility of its talks. All
+# talks of a session share its room, which is kept such that exported schedules tell where to go
+SESSION_LEVEL_COLUMNS: list[str] = [
+    "Session Name",
+    "Session",
+    "Stream Name",
+    "Track Code",
+    "Stream",
+    "Timeslot",
+    "Schedule",
+    "Start Timestamp",
+    "End Timestamp",
+    "Room",
+]
+UTILITY_COLUMN: str = "Utility"
+
 
 class MaximizeSessionAttendanceUtility:
     __dict_session_details: dict[str, dict[str, Any]]
     __opt_model: pulp.LpProblem
 
-    __dict_session_attendance_variables: dict[str, pulp.LpBinary] = {}
+    __dict_session_attendance_variables: dict[str, pulp.LpBinary]
 
-    __at_most_one_session_per_slot_constraints: list[pulp.LpConstraint] = []
-    __ensure_session_attendance_constraints: list[pulp.LpConstraint] = []
+    __at_most_one_session_per_slot_constraints: list[pulp.LpConstraint]
+    __ensure_session_attendance_constraints: list[pulp.LpConstraint]
 
     def __init__(self, dict_sessions: dict[str, dict[str, Any]]) -> None:
         self.__dict_session_details = dict_sessions
+        # Variables and constraints are kept per model, as many models are created within the same process
+        self.__dict_session_attendance_variables = {}
+        self.__at_most_one_session_per_slot_constraints = []
+        self.__ensure_session_attendance_constraints = []
         self.__opt_model = pulp.LpProblem(
             "Maximize Overall Session Attendance Utility", sense=pulp.LpMaximize
         )
@@ -107,18 +127,8 @@ class MaximizeSessionAttendanceUtility:
 
     @staticmethod
     def __compute_session_utility(df_potential_talks: pd.DataFrame) -> pd.DataFrame:
-        session_level_columns = [
-            "Session Name",
-            "Session",
-            "Stream Name",
-            "Track Code",
-            "Stream",
-            "Timeslot",
-            "Schedule",
-            "Start Timestamp",
-            "End Timestamp",
-        ]
-        utility_column = "Utility"
+        session_level_columns = SESSION_LEVEL_COLUMNS
+        utility_column = UTILITY_COLUMN
 
         columns_to_keep = session_level_columns + [utility_column]
         missing_columns = set(columns_to_keep).difference(df_potential_talks.columns)
@@ -127,7 +137,7 @@ class MaximizeSessionAttendanceUtility:
             raise KeyError(f"Missing columns {missing_columns_str} in DataFrame")
 
         df_session_level_utility = (
-            df_potential_talks[columns_to_keep].groupby(by=session_level_columns).mean().round(decimals=2)
+            df_potential_talks[columns_to_keep].groupby(by=session_level_columns, dropna=False).mean().round(decimals=2)
         )
         df_session_level_utility.reset_index(inplace=True)
         df_session_level_utility.set_index("Session", inplace=True)
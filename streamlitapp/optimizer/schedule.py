@@ -0,0 +1,33 @@
+import pandas as pd
+
+from optimizer.max_session_utility import MaximizeSessionAttendanceUtility, SESSION_LEVEL_COLUMNS, UTILITY_COLUMN
+
+# The only columns the optimisation model needs, so the input never has to contain e.g. the abstracts of the talks
+OPTIMIZATION_INPUT_COLUMNS: list[str] = SESSION_LEVEL_COLUMNS + [UTILITY_COLUMN]
+
+
+def create_empty_schedule() -> pd.DataFrame:
+    # Sessions are identified by their index in the model, hence the session id is not one of the resulting columns
+    schedule_columns = [column for column in SESSION_LEVEL_COLUMNS if column != "Session"] + [UTILITY_COLUMN]
+    return pd.DataFrame(columns=schedule_columns)
+
+
+def get_optimal_set_of_sessions(df_programme: pd.DataFrame, must_attend_sessions: list[str]) -> pd.DataFrame:
+    # Without any sessions to choose from, e.g. because of a stream filter matching none of the streams, there is
+    # nothing to optimise
+    if len(df_programme) == 0:
+        return create_empty_schedule()
+
+    opt_model = MaximizeSessionAttendanceUtility.create_base_session_level_model(df_programme)
+
+    # Some of the sessions we just must attend, e.g. speaking at them. Hence, add them as fixed to the model
+    opt_model.force_session_selection(must_attend_sessions)
+
+    opt_model.solve()
+
+    selected_session = opt_model.get_optimal_session_attendance()
+    if len(selected_session) == 0:
+        return create_empty_schedule()
+
+    df_selected_sessions = pd.DataFrame(selected_session).sort_values(by=["Timeslot"])
+    return df_selected_sessions
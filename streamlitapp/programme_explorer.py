@@ -1,29 +1,62 @@
+import numpy as np
 import pandas as pd
 import streamlit as st
 import streamlit.elements.lib.event_utils as st_event_utils
-import data.load as data_loader
 import data.filter as data_filter
 import data.utils as data_utils
+import data.registry as data_registry
 from config import AppConfig
-from optimizer.max_session_utility import MaximizeSessionAttendanceUtility, CannotRetrieveResultsException
+from data.plane import ProgrammeDataPlane, ProgrammeSelection
+import optimizer.schedule as optimizer_schedule
+from optimizer.max_session_utility import CannotRetrieveResultsException
 import components.calendar as calendar
+import components.download as download
+import export.programme as programme_export
 
 st.set_page_config(layout="wide")
 
-def display_multiselect_filters(df_programme: pd.DataFrame) -> None:
+# Filters depending on the contents of a programme, which should be cleared once another programme is selected
+PROGRAMME_DEPENDENT_STATE_KEYS = [
+    "selected_timeslots",
+    "selected_streams",
+    "selected_keywords",
+    "opt_selected_stream",
+    "must_attend_sessions",
+]
+
+
+def reset_programme_dependent_state() -> None:
+    for state_key in PROGRAMME_DEPENDENT_STATE_KEYS:
+        st.session_state.pop(state_key, None)
+
+
+def display_dataset_selection() -> None:
+    all_datasets = data_registry.available_datasets()
+    if len(all_datasets) <= 1:
+        return
+
+    st.selectbox(
+        "Conference",
+        options=list(all_datasets.keys()),
+        format_func=lambda dataset_id: all_datasets[dataset_id].name,
+        key="selected_dataset",
+        on_change=reset_programme_dependent_state,
+    )
+
+def display_multiselect_filters(data_plane: ProgrammeDataPlane) -> None:
     # col_multiselect_filters = st.columns(3)
 
     # Add a timeslot filter to the page itself
-    potential_timeslots = data_utils.get_unique_timeslots(df_programme)
+    potential_timeslots = data_utils.get_unique_timeslots(data_plane)
     st.multiselect("Timeslot(s)", potential_timeslots, key="selected_timeslots")
 
     # Add a stream filter to the page itself, in the column next to the timeslot filter
-    potential_streams = data_utils.get_unique_streams(df_programme, filter_by_state=True)
+    potential_streams = data_utils.get_unique_streams(data_plane, filter_by_state=True)
     preset_streams = data_utils.get_preselected_streams(potential_streams)
     st.multiselect("Stream(s)", potential_streams, key="selected_streams", default=preset_streams)
 
     # Add a keywords filter to the page itself
-    potential_keywords = data_utils.get_unique_keywords(df_programme)
+    potential_keywords = data_utils.get_unique_keywords(data_plane)
     st.multiselect("Keyword(s)", potential_keywords, key="selected_keywords")
 
 
@@ -34,14 +67,14 @@ def display_text_based_filters() -> None:
     st.text_input("Search in abstract ...", key="abstract_search")
 
 
-def display_optimization_model_filters(df_programme: pd.DataFrame) -> None:
+def display_optimization_model_filters(data_plane: ProgrammeDataPlane) -> None:
     col_optimization_filters = st.columns(2)
 
-    all_streams = data_utils.get_unique_streams(df_programme, filter_by_state=False)
+    all_streams = data_utils.get_unique_streams(data_plane, filter_by_state=False)
 
     col_optimization_filters[0].multiselect("Restrict to streams", options=all_streams, key="opt_selected_stream")
 
-    all_sessions = data_utils.get_unique_sessions_for_optimization_model(df_programme)
+    all_sessions = data_utils.get_unique_sessions_for_optimization_model(data_plane)
     preselected_sessions = data_utils.get_preselected_sessions_for_optimization_model(all_sessions)
     col_optimization_filters[1].multiselect(
         "Must-attend Sessions",
@@ -51,7 +84,11 @@ def display_optimization_model_filters(df_programme: pd.DataFrame) -> None:
     )
 
 
-def display_all_selected_abstracts(df_programme: pd.DataFrame, selection_events: st_event_utils.AttributeDictionary) -> None:
+def display_all_selected_abstracts(
+    data_plane: ProgrammeDataPlane,
+    programme_selection: ProgrammeSelection,
+    selection_events: st_event_utils.AttributeDictionary,
+) -> None:
     selected_rows = selection_events['rows']
     limit = AppConfig.ABSTRACT_DISPLAY_LIMIT
 
@@ -67,7 +104,9 @@ def display_all_selected_abstracts(df_programme: pd.DataFrame, selection_events:
         )
         return
 
-    df_selected_abstracts = df_programme.iloc[selected_rows]
+    # The selected rows are positions in the displayed table, which map onto the row ids of the programme selection
+    selected_row_ids = programme_selection.row_ids[np.asarray(selected_rows, dtype=int)]
+    df_selected_abstracts = data_plane.take(selected_row_ids)
 
     for index, record in df_selected_abstracts.iterrows():
         exp_title = f"{record['Contribution Title']} ({record['Track Code']})"
@@ -79,42 +118,43 @@ def display_all_selected_abstracts(df_programme: pd.DataFrame, selection_events:
     return
 
 
-def conference_browsing_tab(df_complete_programme: pd.DataFrame, **kwargs) -> None:
+def conference_browsing_tab(data_plane: ProgrammeDataPlane, **kwargs) -> None:
     container = kwargs.get('container', st)
 
     with container:
         # Before the programme can be displayed, we need to filter it based on the user's selection, using the session state
-        df_filtered = data_filter.filter_programme_based_on_state(df_complete_programme)
+        # Only the row ids of the selection are kept, and merely the displayed columns are copied out of the data plane
+        programme_selection = data_filter.filter_programme_based_on_state(data_plane)
+        displayed_columns = ['Schedule', 'Session Name', 'Contribution Title', 'Track Code', 'Keywords']
+        df_filtered = data_plane.take(programme_selection.row_ids, columns=displayed_columns)
 
         # Users should be able to select rows in the dataframe to display the requested abstracts. To do so at a later
         # point, we need to capture the selection events. The on_select="rerun" setting will enable selections.
         st.write(":arrow_down: Select rows to display the abstracts below the table.")
         programme_table_events = st.dataframe(
             df_filtered,
-            column_order=['Schedule', 'Session Name', 'Contribution Title', 'Track Code', 'Keywords'],
+            column_order=displayed_columns,
             hide_index=True,
             on_select="rerun",
             selection_mode="multi-row",
         )
 
-        display_all_selected_abstracts(df_filtered, programme_table_events.selection)
+        download.render_export_download(
+            lambda: data_plane.take_in_chunks(programme_selection.row_ids, programme_export.DEFAULT_CHUNK_SIZE),
+            dataset_id=data_plane.dataset_id,
+            filename_stem="conference_programme",
+            key="programme",
+        )
 
+        display_all_selected_abstracts(data_plane, programme_selection, programme_table_events.selection)
 
-def get_optimal_set_of_sessions(df_programme: pd.DataFrame) -> pd.DataFrame:
-    opt_model = MaximizeSessionAttendanceUtility.create_base_session_level_model(df_programme)
 
-    # Some of the sessions we just must attend, e.g. speaking at them. Hence, add them as fixed to the model
+def get_optimal_set_of_sessions(df_programme: pd.DataFrame) -> pd.DataFrame:
     must_attend_sessions = st.session_state.get("must_attend_sessions", [])
-    opt_model.force_session_selection(must_attend_sessions)
-
-    opt_model.solve()
-
-    selected_session = opt_model.get_optimal_session_attendance()
-    df_selected_sessions = pd.DataFrame(selected_session).sort_values(by=["Timeslot"])
-    return df_selected_sessions
+    return optimizer_schedule.get_optimal_set_of_sessions(df_programme, must_attend_sessions)
 
 
-def schedule_optimizer_tab(df_complete_programme: pd.DataFrame, **kwargs) -> None:
+def schedule_optimizer_tab(data_plane: ProgrammeDataPlane, **kwargs) -> None:
     container = kwargs.get('container', st)
 
     with container:
@@ -129,8 +169,11 @@ def schedule_optimizer_tab(df_complete_programme: pd.DataFrame, **kwargs) -> Non
             available one such that we have at most one session per timeslot.
         """)
 
-        display_optimization_model_filters(df_complete_programme)
-        df_available_programme = data_filter.filter_optimization_input_based_on_state(df_complete_programme)
+        display_optimization_model_filters(data_plane)
+        optimization_input_selection = data_filter.filter_optimization_input_based_on_state(data_plane)
+        df_available_programme = data_plane.take(
+            optimization_input_selection.row_ids, columns=optimizer_schedule.OPTIMIZATION_INPUT_COLUMNS
+        )
 
         columns_result_display = st.columns(2)
 
@@ -145,16 +188,24 @@ def schedule_optimizer_tab(df_complete_programme: pd.DataFrame, **kwargs) -> Non
             column_order=["Schedule", "Stream Name", "Track Code", "Session Name", "Title", "Utility"],
             hide_index=True
         )
+        with columns_result_display[0]:
+            download.render_export_download(
+                lambda: programme_export.iter_programme_chunks(df_selected_sessions),
+                dataset_id=data_plane.dataset_id,
+                filename_stem="optimised_schedule",
+                key="schedule",
+            )
 
         with columns_result_display[1]:
             st.radio("Select view", calendar.available_calendar_views().keys(), key="calendar_view")
-            calendar.render_calendar_from_sessions(df_selected_sessions)
+            programme_date_range = data_utils.get_programme_date_range(data_plane)
+            programme_time_range = data_utils.get_programme_time_range(data_plane)
+            calendar.render_calendar_from_sessions(df_selected_sessions, programme_date_range, programme_time_range)
 
 
-def main() -> None:
-    filepath_programme = AppConfig.FILEPATH_CONFERENCE_PROGRAMME
-    df_complete_programme = data_loader.load_and_prepare_programme_data(filepath_programme)
-    df_complete_programme = data_utils.assign_random_utilities_to_programme_entries(df_complete_programme)
+def main(dataset: data_registry.ConferenceDataset) -> None:
+    # The programme is shared by all sessions, which only hold on to the filters and the selected row ids
+    data_plane = data_registry.load_data_plane(dataset.dataset_id)
 
     all_tabs_to_show = ['Browse Conference Programme']
     if AppConfig.SHOW_OPTIMIZATION_TAB:
@@ -163,25 +214,32 @@ def main() -> None:
     main_page_tabs = st.tabs(all_tabs_to_show)
 
     with st.sidebar:
-        display_multiselect_filters(df_complete_programme)
+        display_dataset_selection()
+
+        display_multiselect_filters(data_plane)
 
         display_text_based_filters()
 
-    conference_browsing_tab(df_complete_programme, container=main_page_tabs[0])
+    conference_browsing_tab(data_plane, container=main_page_tabs[0])
 
     if AppConfig.SHOW_OPTIMIZATION_TAB:
-        schedule_optimizer_tab(df_complete_programme, container=main_page_tabs[1])
+        schedule_optimizer_tab(data_plane, container=main_page_tabs[1])
 
 
 if __name__ == '__main__':
-    st.title('EURO2024 Conference Programme Explorer')
-
-    st.info(
-        f'''
-            Hi there, this streamlit application allows you to explore the EURO2024 conference programme. The data 
-            shown here originates from an export created on {AppConfig.DATE_OF_PROGRAMME_EXPORT}. For the most 
-            up-to-date programme, please visit {AppConfig.CONFERENCE_PROGRAMME_LINK}.
-        '''
-    )
+    # The selectbox is rendered in the sidebar later on, its value from the previous run determines the programme
+    selected_dataset_id = st.session_state.get("selected_dataset", AppConfig.DEFAULT_DATASET_ID)
+    selected_dataset = data_registry.get_dataset(selected_dataset_id)
+
+    st.title(f'{selected_dataset.name} Conference Programme Explorer')
+
+    if selected_dataset.export_date != '':
+        st.info(
+            f'''
+                Hi there, this streamlit application allows you to explore the {selected_dataset.name} conference
+                programme. The data shown here originates from an export created on {selected_dataset.export_date}.
+                For the most up-to-date programme, please visit {selected_dataset.programme_link}.
+            '''
+        )
 
-    main()
+    main(selected_dataset)
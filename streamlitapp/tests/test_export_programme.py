@@ -0,0 +1,103 @@
+import re
+import unittest
+
+import pandas as pd
+
+import export.programme as programme_export
+
+"""
+Unit tests for the iCalendar export, i.e. the escaping of text values and the folding of long content lines following
+RFC 5545. Run them from the streamlitapp directory with `python -m unittest`.
+"""
+
+
+def unfold_ical_lines(ical_bytes: bytes) -> list[bytes]:
+    # Folded lines continue after a line break followed by a single space
+    return ical_bytes.replace(b"\r\n ", b"").split(b"\r\n")
+
+
+def create_programme_entry(**overrides) -> dict:
+    programme_entry = {
+        "Paper Id": 1,
+        "Contribution Title": "Vehicle routing with time windows",
+        "Session Name": "Routing I",
+        "Track Code": "MA-01",
+        "Start Timestamp": pd.Timestamp("2024-07-01 08:30"),
+        "End Timestamp": pd.Timestamp("2024-07-01 10:00"),
+        "Room": "Sportshallen",
+        "Keywords": ["Routing"],
+        "Abstract": "An abstract.",
+    }
+    programme_entry.update(overrides)
+    return programme_entry
+
+
+class TestFoldIcalLine(unittest.TestCase):
+
+    def assert_valid_folding(self, line: str) -> None:
+        folded_line = programme_export.fold_ical_line(line).encode("utf-8")
+
+        self.assertTrue(folded_line.endswith(b"\r\n"))
+        for physical_line in folded_line[:-2].split(b"\r\n"):
+            self.assertLessEqual(len(physical_line), programme_export.ICAL_LINE_LIMIT)
+            # Every physical line has to be valid UTF-8 on its own, i.e. no character is split
+            physical_line.decode("utf-8")
+        self.assertEqual(unfold_ical_lines(folded_line), [line.encode("utf-8"), b""])
+
+    def test_short_line_is_not_folded(self):
+        line = "SUMMARY:" + "a" * 67
+        self.assertEqual(programme_export.fold_ical_line(line), line + "\r\n")
+
+    def test_long_ascii_line_is_folded(self):
+        # The 512 octets fit on a first line of 75 octets and 6 continuation lines of 74 octets after their space
+        line = "DESCRIPTION:" + "a" * 500
+        self.assertEqual(programme_export.fold_ical_line(line).count("\r\n "), 6)
+        self.assert_valid_folding(line)
+
+    def test_multi_byte_characters_at_the_cut_are_not_split(self):
+        # Shift the characters over the 75th octet, such that every byte of them ends up at the cut once
+        for character in ["é", "€", "😀"]:
+            for prefix_length in range(70, 76):
+                with self.subTest(character=character, prefix_length=prefix_length):
+                    self.assert_valid_folding("S" * prefix_length + character * 40)
+
+
+class TestEscapeIcalText(unittest.TestCase):
+
+    def test_special_characters_are_escaped(self):
+        self.assertEqual(programme_export.escape_ical_text("a\\b;c,d"), "a\\\\b\\;c\\,d")
+
+    def test_line_breaks_are_escaped(self):
+        self.assertEqual(programme_export.escape_ical_text("a\r\nb\nc"), "a\\nb\\nc")
+
+    def test_commas_within_a_keyword_are_escaped(self):
+        event = create_programme_entry(Keywords=["Scheduling, Timetabling", "Routing"])
+        ical_event = programme_export.generate_ical_event(event, "euro2024", "20240621T000000Z")
+        self.assertIn("CATEGORIES:Scheduling\\, Timetabling,Routing\r\n", ical_event)
+
+
+class TestStreamIcalExport(unittest.TestCase):
+
+    def export_ical(self, df_programme: pd.DataFrame, chunk_size: int) -> bytes:
+        programme_chunks = programme_export.iter_programme_chunks(df_programme, chunk_size)
+        ical_bytes = b"".join(programme_export.stream_export(programme_chunks, "ics", "euro2024"))
+        # The export time differs between exports, hence it is left out when comparing them
+        return re.sub(rb"DTSTAMP:\d{8}T\d{6}Z", b"DTSTAMP:", ical_bytes)
+
+    def test_line_breaks_in_values_keep_the_export_byte_identical(self):
+        df_programme = pd.DataFrame([
+            create_programme_entry(**{"Paper Id": paper_id, "Abstract": "First line\r\nSecond line é\n" * 20})
+            for paper_id in range(5)
+        ])
+
+        ical_bytes = self.export_ical(df_programme, chunk_size=2)
+
+        self.assertEqual(ical_bytes, self.export_ical(df_programme, chunk_size=500))
+        # Line breaks within values are escaped, such that every line ends with CRLF and no bare CR or LF remains
+        self.assertNotIn(b"\n", ical_bytes.replace(b"\r\n", b""))
+        self.assertNotIn(b"\r", ical_bytes.replace(b"\r\n", b""))
+        self.assertEqual(ical_bytes.count(b"BEGIN:VEVENT"), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()